@@ -1,4 +1,11 @@
+import multiprocessing
+
 from windshadow_engine.main import run
 
 if __name__ == "__main__":
+    # In the frozen onefile exe every spawn-pool worker (and the Manager
+    # child) re-executes this entry point with __name__ == "__main__";
+    # freeze_support() diverts those into worker mode instead of booting
+    # rogue engine servers that clobber port.json. No-op when unfrozen.
+    multiprocessing.freeze_support()
     run()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 import time
 from pathlib import Path
 
@@ -17,7 +18,7 @@ def test_demo_smoke(tmp_path: Path):
 
     dem_src = Path(__file__).resolve().parents[2] / "demo" / cfg["dem_path"]
     dem_dst = project_dir / "demo_dem.asc"
-    dem_dst.write_text(dem_src.read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(dem_src, dem_dst)
 
     req = cfg.copy()
     req["project_path"] = str(project_dir)
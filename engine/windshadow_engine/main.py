@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import functools
 import json
 import math
+import multiprocessing
 import os
 import threading
 import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
+import rasterio.errors
+from matplotlib import colormaps
+from numba import get_num_threads, get_thread_id, njit, prange
+from PIL import Image
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from pyproj import CRS, Transformer
+from rasterio.windows import Window, from_bounds
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 
@@ -58,14 +66,39 @@ class JobState:
     progress_pct: int = 0
     progress_message: str = "Queued"
     error: str | None = None
-    logs: list[str] = field(default_factory=list)
+    logs: deque[str] = field(default_factory=lambda: deque(maxlen=400))
     outputs: dict[str, str] = field(default_factory=dict)
     overlay_bounds: list[list[float]] | None = None
     stats: dict[str, float] | None = None
+    updated: threading.Event = field(default_factory=threading.Event, repr=False)
+    # Serializes snapshot application against serialization: pollers and
+    # SSE streams sync/read the same JobState concurrently.
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    future: Future | None = field(default=None, repr=False)
 
 
 app = FastAPI(title="Wind Shadow Engine")
-JOBS: dict[str, JobState] = {}
+JOBS: OrderedDict[str, JobState] = OrderedDict()
+JOBS_LOCK = threading.Lock()
+MAX_JOBS = 64
+
+# Jobs run in spawned subprocesses so rendering never shares a GIL with
+# the API. Pool and manager are created on first submission: a spawned
+# child re-imports this module, and building them at import time would
+# recurse.
+MP_CONTEXT = multiprocessing.get_context("spawn")
+_POOL: ProcessPoolExecutor | None = None
+_SHARED: Any = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> tuple[ProcessPoolExecutor, Any]:
+    global _POOL, _SHARED
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1), mp_context=MP_CONTEXT)
+            _SHARED = MP_CONTEXT.Manager().dict()
+    return _POOL, _SHARED
 
 
 def log(job: JobState, msg: str) -> None:
@@ -73,6 +106,7 @@ def log(job: JobState, msg: str) -> None:
     line = f"[{ts}] {msg}"
     job.logs.append(line)
     job.progress_message = msg
+    job.updated.set()
 
 
 def save_project_state(project_path: Path, payload: dict[str, Any]) -> None:
@@ -80,14 +114,23 @@ def save_project_state(project_path: Path, payload: dict[str, Any]) -> None:
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
-def read_dem(dem_path: Path):
-    with rasterio.open(dem_path) as ds:
-        arr = ds.read(1)
-        transform = ds.transform
+def read_dem_window(dem_path: Path, bounds: tuple[float, float, float, float]):
+    """Read only the DEM sub-window covering the model area."""
+    with rasterio.open(dem_path, sharing=False) as ds:
+        full = Window(0, 0, ds.width, ds.height)
+        try:
+            window = from_bounds(*bounds, transform=ds.transform)
+            window = window.round_offsets(op="floor").round_lengths(op="ceil").intersection(full)
+        except rasterio.errors.WindowError:
+            # Model area outside the raster; keep the full (tiny) header
+            # read path so callers can still filter turbines on bounds.
+            window = full
+        arr = ds.read(1, window=window)
+        transform = ds.window_transform(window)
         crs = ds.crs
         nodata = ds.nodata
-        bounds = ds.bounds
-    return arr, transform, crs, nodata, bounds
+        dem_bounds = ds.bounds
+    return arr, transform, crs, nodata, dem_bounds
 
 
 def rasterize(job: JobState, req: RunRequest) -> None:
@@ -100,11 +143,6 @@ def rasterize(job: JobState, req: RunRequest) -> None:
     if req.cellsize_m not in CELLSIZE_ALLOWED:
         raise ValueError("cellsize_m must be one of 8,10,20,25,50")
 
-    dem, dem_tr, dem_crs, dem_nodata, dem_bounds = read_dem(Path(req.dem_path))
-    model_crs = CRS.from_user_input(req.epsg)
-    if dem_crs and dem_crs != model_crs:
-        log(job, "Warning: DEM CRS differs from selected EPSG. Continuing with selected EPSG.")
-
     xs = [t.x for t in req.turbines]
     ys = [t.y for t in req.turbines]
     minx, maxx = min(xs) - req.buffer_m, max(xs) + req.buffer_m
@@ -118,6 +156,15 @@ def rasterize(job: JobState, req: RunRequest) -> None:
     maxx = minx + width
     maxy = miny + height
 
+    dem, dem_tr, dem_crs, dem_nodata, dem_bounds = read_dem_window(
+        Path(req.dem_path), (minx, miny, maxx, maxy)
+    )
+    # Numba can't unbox the rasterio Affine, so hand the kernels raw scalars.
+    tr_c, tr_a, tr_f, tr_e = dem_tr.c, dem_tr.a, dem_tr.f, dem_tr.e
+    model_crs = CRS.from_user_input(req.epsg)
+    if dem_crs and dem_crs != model_crs:
+        log(job, "Warning: DEM CRS differs from selected EPSG. Continuing with selected EPSG.")
+
     cell = req.cellsize_m
     ncols = max(1, int(math.ceil(width / cell)))
     nrows = max(1, int(math.ceil(height / cell)))
@@ -129,37 +176,75 @@ def rasterize(job: JobState, req: RunRequest) -> None:
         steps.append(d)
         d += timedelta(minutes=15)
 
-    total_ops = max(1, len(steps) * len(req.turbines))
-    op = 0
-
+    # One vectorized solar pass for the whole year instead of an
+    # approx_solar call per (turbine, timestep) pair.
+    elev_arr, azim_arr = solar_table(steps)
+    day_mask = elev_arr > 0
+    inv_tan_elev = np.where(day_mask, 1.0 / np.tan(np.deg2rad(elev_arr)), 0.0).astype(np.float32)
+    ray_rad = np.deg2rad((azim_arr + 180) % 360)
+    sin_ray = np.sin(ray_rad).astype(np.float32)
+    cos_ray = np.cos(ray_rad).astype(np.float32)
+    # Night slots never draw anything; compress the tables to the daylit
+    # subset so the kernel iterates exactly the work that exists.
+    inv_tan_elev = inv_tan_elev[day_mask]
+    sin_ray = sin_ray[day_mask]
+    cos_ray = cos_ray[day_mask]
+    # Cache blocking for the scatter: slots with the same azimuth deposit
+    # into the same swath of cells, so ordering draws by azimuth keeps
+    # each swath's stripe of the grid resident in cache across
+    # consecutive timesteps instead of revisiting it once per day.
+    order = np.argsort(azim_arr[day_mask], kind="stable")
+    inv_tan_elev = inv_tan_elev[order]
+    sin_ray = sin_ray[order]
+    cos_ray = cos_ray[order]
+
+    turbines = []
     for t in req.turbines:
         if not (dem_bounds.left <= t.x <= dem_bounds.right and dem_bounds.bottom <= t.y <= dem_bounds.top):
             log(job, f"Turbine {t.id} outside DEM, ignored")
             continue
-        z_ground = sample_dem(dem, dem_tr, t.x, t.y)
-        hub_z = z_ground + t.hub_height_m
-
-        for dt in steps:
-            elev, azim = approx_solar(dt)
-            if elev <= 0:
-                op += 1
-                continue
-            length = min(20_000, t.hub_height_m / math.tan(math.radians(elev)))
-            if req.terrain_aware:
-                length = terrain_adjusted_length(dem, dem_tr, t.x, t.y, hub_z, elev, azim, cell, length)
-
-            draw_shadow(grid, minx, miny, cell, t.x, t.y, azim, length, t.rotor_diameter_m)
-            op += 1
-            if op % 500 == 0:
-                job.progress_pct = int(op * 100 / total_ops)
+        turbines.append(t)
+
+    if turbines:
+        tx = np.array([t.x for t in turbines], dtype=np.float64)
+        ty = np.array([t.y for t in turbines], dtype=np.float64)
+        hub_h = np.array([t.hub_height_m for t in turbines], dtype=np.float64)
+        hub_z = np.array(
+            [sample_dem(dem, tr_c, tr_a, tr_f, tr_e, t.x, t.y) + t.hub_height_m for t in turbines],
+            dtype=np.float64,
+        )
+        spread_arr = np.array(
+            [max(1, int((t.rotor_diameter_m / 2) / cell)) for t in turbines], dtype=np.int64
+        )
+
+        log(job, f"Rendering {len(turbines)} turbines")
+        job.progress_pct = 10
+
+        # One grid and stamp per worker thread so prange threads never
+        # contend on the accumulator; the grids hold uint16 quarter-hour
+        # counts, half the scatter traffic of float32 hours. The stamps
+        # record the last timestep that shadowed each cell, so a cell
+        # counts at most one deposit per slot no matter how many swaths
+        # (brush lines or turbines) cross it. That caps a cell's count
+        # at the number of daylit slots in the year — at most 49 per
+        # day, 17,885 total — comfortably under uint16's 65,535.
+        n_threads = get_num_threads()
+        grid_stack = np.zeros((n_threads, nrows, ncols), dtype=np.uint16)
+        stamp_stack = np.full((n_threads, nrows, ncols), 65535, dtype=np.uint16)
+        render = _render_kernel(cell)
+        render(
+            grid_stack, stamp_stack, tx, ty, hub_h, hub_z, spread_arr,
+            sin_ray, cos_ray, inv_tan_elev,
+            dem, tr_c, tr_a, tr_f, tr_e,
+            minx, miny, req.terrain_aware,
+        )
+        counts = grid_stack.sum(axis=0, dtype=np.uint32)
+        grid, gmin, gmax, gmean = _counts_to_hours(counts)
+    else:
+        gmin = gmax = gmean = 0.0
 
     job.progress_pct = 85
-    valid = grid[grid >= 0]
-    stats = {
-        "min": float(np.min(valid)) if valid.size else 0,
-        "max": float(np.max(valid)) if valid.size else 0,
-        "mean": float(np.mean(valid)) if valid.size else 0,
-    }
+    stats = {"min": float(gmin), "max": float(gmax), "mean": float(gmean)}
     job.stats = stats
 
     asc_path = outputs / "shadow_hours.asc"
@@ -188,53 +273,205 @@ def rasterize(job: JobState, req: RunRequest) -> None:
     log(job, "Completed")
 
 
-def approx_solar(dt: datetime) -> tuple[float, float]:
-    h = dt.hour + dt.minute / 60
-    if h < 6 or h > 18:
-        return -5, 0
-    elev = max(0.1, 60 * math.sin((h - 6) / 12 * math.pi))
-    azim = 90 + ((h - 6) / 12) * 180
+def solar_table(steps: list[datetime]) -> tuple[np.ndarray, np.ndarray]:
+    """Approximate solar elevation/azimuth for every timestep in one pass."""
+    hours = np.array([s.hour + s.minute / 60 for s in steps], dtype=np.float32)
+    elev = np.where(
+        (hours < 6) | (hours > 18),
+        np.float32(-5.0),
+        np.maximum(np.float32(0.1), 60 * np.sin((hours - 6) / 12 * np.pi)),
+    ).astype(np.float32)
+    azim = (90 + ((hours - 6) / 12) * 180).astype(np.float32)
     return elev, azim
 
 
-def sample_dem(arr, tr, x, y):
-    col = int((x - tr.c) / tr.a)
-    row = int((tr.f - y) / abs(tr.e))
-    row = np.clip(row, 0, arr.shape[0] - 1)
-    col = np.clip(col, 0, arr.shape[1] - 1)
-    return float(arr[row, col])
-
-
-def terrain_adjusted_length(dem, tr, x, y, hub_z, elev, azim, step, max_len):
-    rad = math.radians((azim + 180) % 360)
-    tan_e = math.tan(math.radians(elev))
+@njit(cache=True, parallel=True)
+def _init_parallel_runtime(n):
+    total = 0
+    for i in prange(n):
+        total += i
+    return total
+
+
+# Touch numba's parallel runtime from the importing (main) thread: if its
+# first initialization happens on a worker thread, interpreter shutdown
+# deadlocks joining the numba thread pool (reproduced on numba 0.61.2 and
+# 0.67). Cheap here — the trivial kernel comes from the on-disk jit cache
+# after the first ever import.
+_init_parallel_runtime(1)
+
+
+@njit(cache=True, fastmath=True)
+def sample_dem(arr, tr_c, tr_a, tr_f, tr_e, x, y):
+    # Bilinear 4-tap sample; nearest-neighbor aliased badly when the ray
+    # step is close to the DEM cell size and could skip narrow ridges.
+    fx = (x - tr_c) / tr_a
+    fy = (tr_f - y) / abs(tr_e)
+    c0 = int(math.floor(fx))
+    r0 = int(math.floor(fy))
+    wx = min(max(fx - c0, 0.0), 1.0)
+    wy = min(max(fy - r0, 0.0), 1.0)
+    c0 = min(max(c0, 0), arr.shape[1] - 1)
+    r0 = min(max(r0, 0), arr.shape[0] - 1)
+    c1 = min(c0 + 1, arr.shape[1] - 1)
+    r1 = min(r0 + 1, arr.shape[0] - 1)
+    return (
+        (1 - wx) * (1 - wy) * arr[r0, c0]
+        + wx * (1 - wy) * arr[r0, c1]
+        + (1 - wx) * wy * arr[r1, c0]
+        + wx * wy * arr[r1, c1]
+    )
+
+
+@njit(cache=True, fastmath=True)
+def terrain_adjusted_length(dem, tr_c, tr_a, tr_f, tr_e, x, y, hub_z, sin_r, cos_r, inv_tan_e, step, max_len):
+    # All trig comes precomputed from the solar table: each step is three
+    # adds, a DEM fetch and a compare, and the walk still exits at the
+    # first hit.
+    dx = step * sin_r
+    dy = step * cos_r
+    dz = step / inv_tan_e
+    px = x
+    py = y
+    z_ray = hub_z
     d = step
     while d <= max_len:
-        px = x + d * math.sin(rad)
-        py = y + d * math.cos(rad)
-        z_ray = hub_z - d * tan_e
-        z_dem = sample_dem(dem, tr, px, py)
-        if z_ray <= z_dem:
+        px += dx
+        py += dy
+        z_ray -= dz
+        if z_ray <= sample_dem(dem, tr_c, tr_a, tr_f, tr_e, px, py):
             return d
         d += step
     return max_len
 
 
-def draw_shadow(grid, minx, miny, cell, x, y, azim, length, width):
-    rad = math.radians((azim + 180) % 360)
-    steps = int(max(1, length / cell))
-    spread = max(1, int((width / 2) / cell))
-    for i in range(steps):
-        d = i * cell
-        px = x + d * math.sin(rad)
-        py = y + d * math.cos(rad)
-        col = int((px - minx) / cell)
-        row = int((py - miny) / cell)
-        if 0 <= row < grid.shape[0] and 0 <= col < grid.shape[1]:
-            for s in range(-spread, spread + 1):
-                c2 = col + s
-                if 0 <= c2 < grid.shape[1]:
-                    grid[row, c2] += 0.25
+@njit(cache=True, fastmath=True)
+def _counts_to_hours(counts):
+    # Single fused traversal: converts quarter-hour counts to float32
+    # hours and gathers min/max/mean on the way, instead of a separate
+    # masked copy plus three more full-grid reductions.
+    grid = np.empty(counts.shape, dtype=np.float32)
+    gmin = counts[0, 0] * 0.25
+    gmax = gmin
+    total = 0.0
+    for r in range(counts.shape[0]):
+        for c in range(counts.shape[1]):
+            v = counts[r, c] * 0.25
+            grid[r, c] = v
+            if v < gmin:
+                gmin = v
+            if v > gmax:
+                gmax = v
+            total += v
+    return grid, gmin, gmax, total / counts.size
+
+
+@functools.lru_cache(maxsize=8)
+def _render_kernel(cell: float):
+    """JIT a render kernel specialized for one cell size.
+
+    cell is a closure constant to numba, so the grid conversions
+    constant-fold at compile time. Closures can't use the on-disk jit
+    cache, but the lru_cache keeps it to one compile per cell size per
+    process, and the pooled worker processes live across jobs.
+
+    Parallelism runs over timesteps: each slot is rendered for all
+    turbines by one thread, which is what lets the stamp dedupe
+    overlapping same-slot swaths from different turbines.
+    """
+    draw_shadow = _draw_kernel(cell)
+
+    @njit(parallel=True, fastmath=True)
+    def render(grid_stack, stamp_stack, tx, ty, hub_h, hub_z, spread_arr,
+               sin_ray, cos_ray, inv_tan_elev,
+               dem, tr_c, tr_a, tr_f, tr_e, minx, miny, terrain_aware):
+        for k in prange(sin_ray.shape[0]):
+            tid = get_thread_id()
+            grid = grid_stack[tid]
+            stamp = stamp_stack[tid]
+            # 65535 is the never-written stamp sentinel; the daylit year
+            # has 17,885 slots, well clear of it.
+            kk = np.uint16(k)
+            for i in range(tx.shape[0]):
+                length = min(20_000.0, hub_h[i] * inv_tan_elev[k])
+                if terrain_aware:
+                    length = terrain_adjusted_length(
+                        dem, tr_c, tr_a, tr_f, tr_e, tx[i], ty[i], hub_z[i],
+                        sin_ray[k], cos_ray[k], inv_tan_elev[k], cell, length,
+                    )
+                draw_shadow(grid, stamp, kk, spread_arr[i], minx, miny, tx[i], ty[i], sin_ray[k], cos_ray[k], length)
+
+    return render
+
+
+@functools.lru_cache(maxsize=8)
+def _draw_kernel(cell: float):
+    @njit(fastmath=True, boundscheck=False)
+    def draw_shadow(grid, stamp, k, spread, minx, miny, x, y, sin_r, cos_r, length):
+        nrows, ncols = grid.shape
+
+        c0 = int((x - minx) / cell)
+        r0 = int((y - miny) / cell)
+        c1 = int((x + length * sin_r - minx) / cell)
+        r1 = int((y + length * cos_r - miny) / cell)
+
+        dx = abs(c1 - c0)
+        dy = -abs(r1 - r0)
+        sx = 1 if c0 < c1 else -1
+        sy = 1 if r0 < r1 else -1
+        err = dx + dy
+
+        # Brush table: integer offsets along the perpendicular of the
+        # ray, so the swath is oriented correctly for any azimuth instead
+        # of always running in the column direction. Rounding makes
+        # neighboring offsets collapse onto the same cell for diagonal
+        # rays; the offsets are monotone along the perpendicular, so
+        # dropping entries equal to their predecessor dedupes the table.
+        seg = math.sqrt(float((c1 - c0) * (c1 - c0) + (r1 - r0) * (r1 - r0)))
+        if seg == 0.0:
+            seg = 1.0
+        dirc = (c1 - c0) / seg
+        dirr = (r1 - r0) / seg
+        n_off = 2 * spread + 1
+        offc = np.empty(n_off, dtype=np.int64)
+        offr = np.empty(n_off, dtype=np.int64)
+        m = 0
+        for idx in range(n_off):
+            s = idx - spread
+            oc = int(round(-s * dirr))
+            orow = int(round(s * dirc))
+            if m == 0 or oc != offc[m - 1] or orow != offr[m - 1]:
+                offc[m] = oc
+                offr[m] = orow
+                m += 1
+
+        c = c0
+        r = r0
+        while True:
+            for idx in range(m):
+                cc = c + offc[idx]
+                rr = r + offr[idx]
+                # The stamp catches the remaining overlaps between brush
+                # lines of adjacent ray cells: one deposit per cell per
+                # timestep, full stop.
+                if 0 <= rr < nrows and 0 <= cc < ncols and stamp[rr, cc] != k:
+                    stamp[rr, cc] = k
+                    grid[rr, cc] += 1
+            if c == c1 and r == r1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                if c == c1:
+                    break
+                err += dy
+                c += sx
+            if e2 <= dx:
+                if r == r1:
+                    break
+                err += dx
+                r += sy
+
+    return draw_shadow
 
 
 def write_asc(path: Path, grid: np.ndarray, minx: float, miny: float, cell: float):
@@ -245,7 +482,11 @@ def write_asc(path: Path, grid: np.ndarray, minx: float, miny: float, cell: floa
         f.write(f"yllcorner {miny}\n")
         f.write(f"cellsize {cell}\n")
         f.write("NODATA_value -9999\n")
-        np.savetxt(f, np.flipud(grid), fmt="%.2f")
+        # np.savetxt formats every cell through a Python-level "%.2f";
+        # np.char.mod does the conversion in one C-level pass instead.
+        fmt_rows = np.char.mod("%.2f", np.flipud(grid))
+        f.write("\n".join(" ".join(r) for r in fmt_rows))
+        f.write("\n")
 
 
 def write_tif(path: Path, grid: np.ndarray, minx: float, miny: float, cell: float, crs: CRS):
@@ -260,18 +501,27 @@ def write_tif(path: Path, grid: np.ndarray, minx: float, miny: float, cell: floa
         dtype=grid.dtype,
         crs=crs,
         transform=transform,
+        tiled=True,
+        blockxsize=256,
+        blockysize=256,
+        compress="lzw",
+        predictor=3,
     ) as dst:
         dst.write(np.flipud(grid), 1)
 
 
+_INFERNO_LUT = (colormaps["inferno"](np.linspace(0, 1, 256))[:, :3] * 255).astype(np.uint8)
+
+
 def make_preview(path: Path, grid: np.ndarray):
-    plt.figure(figsize=(8, 6))
-    plt.imshow(grid, cmap="inferno")
-    plt.colorbar(label="Annual shadow hours")
-    plt.title("Wind Shadow Studio Preview")
-    plt.tight_layout()
-    plt.savefig(path, dpi=120)
-    plt.close()
+    # Straight LUT lookup + PNG encode; no matplotlib figure machinery.
+    # North-up and free of figure margins, so the PNG maps 1:1 onto
+    # overlay_bounds in the map view.
+    g = np.flipud(grid).astype(np.float32)
+    lo = float(g.min())
+    span = max(1e-9, float(g.max()) - lo)
+    idx = ((g - lo) / span * 255).astype(np.uint8)
+    Image.fromarray(_INFERNO_LUT[idx], "RGB").save(path)
 
 
 def make_pdf(path: Path, req: RunRequest, stats: dict[str, float], outputs: dict[str, str]):
@@ -294,11 +544,25 @@ def make_pdf(path: Path, req: RunRequest, stats: dict[str, float], outputs: dict
     c.save()
 
 
+@functools.lru_cache(maxsize=64)
+def _get_transformer(epsg_in: int, epsg_out: int = 4326) -> Transformer:
+    return Transformer.from_crs(CRS.from_epsg(epsg_in), CRS.from_epsg(epsg_out), always_xy=True)
+
+
 def to_wgs84_bounds(minx, miny, maxx, maxy, from_crs: CRS):
-    t = Transformer.from_crs(from_crs, CRS.from_epsg(4326), always_xy=True)
-    w, s = t.transform(minx, miny)
-    e, n = t.transform(maxx, maxy)
-    return [[s, w], [n, e]]
+    epsg = from_crs.to_epsg()
+    if epsg is not None:
+        t = _get_transformer(epsg)
+    else:
+        t = Transformer.from_crs(from_crs, CRS.from_epsg(4326), always_xy=True)
+    xs, ys = t.transform([minx, maxx], [miny, maxy])
+    return [[float(ys[0]), float(xs[0])], [float(ys[1]), float(xs[1])]]
+
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
 
 
 @app.get("/health")
@@ -306,47 +570,136 @@ def health():
     return {"status": "ok", "timezone": ROME_TZ, "year": TYPICAL_YEAR}
 
 
+def run_job_process(job_id: str, req_data: dict[str, Any], shared) -> None:
+    """Entry point executed inside a spawned worker process."""
+    job = JobState(id=job_id, status="running", progress_message="Starting")
+    req = RunRequest(**req_data)
+    stop = threading.Event()
+
+    def _pump():
+        while not stop.wait(0.2):
+            shared[job_id] = job_snapshot(job)
+
+    pump = threading.Thread(target=_pump, daemon=True)
+    pump.start()
+    try:
+        rasterize(job, req)
+    except Exception as exc:  # noqa: BLE001
+        job.status = "error"
+        job.error = str(exc)
+        log(job, f"Error: {exc}")
+    finally:
+        stop.set()
+        pump.join()
+        shared[job_id] = job_snapshot(job)
+
+
+def _sync_job(job: JobState) -> None:
+    """Pull the worker process's latest snapshot into the local JobState."""
+    if _SHARED is None or job.status in {"done", "error"}:
+        return
+    snap = _SHARED.get(job.id)
+    if not snap:
+        return
+    with job.lock:
+        # Re-check under the lock: another caller may have applied the
+        # terminal snapshot while ours was fetched, and a stale in-flight
+        # one must not regress done/error back to running.
+        if job.status in {"done", "error"}:
+            return
+        changed = (
+            snap["status"] != job.status
+            or snap["progress_pct"] != job.progress_pct
+            or snap["progress_message"] != job.progress_message
+        )
+        job.status = snap["status"]
+        job.progress_pct = snap["progress_pct"]
+        job.progress_message = snap["progress_message"]
+        job.error = snap["error"]
+        job.outputs = snap["outputs"]
+        job.overlay_bounds = snap["overlay_bounds"]
+        job.stats = snap["stats"]
+        job.logs.clear()
+        job.logs.extend(snap["logs"])
+    if changed:
+        job.updated.set()
+
+
 @app.post("/jobs/run")
 def run_job(req: RunRequest):
     job_id = str(uuid.uuid4())
     job = JobState(id=job_id, status="running", progress_message="Starting")
-    JOBS[job_id] = job
+    pool, shared = _get_pool()
+    with JOBS_LOCK:
+        JOBS[job_id] = job
+        # Evict oldest completed jobs so the registry can't grow forever.
+        if len(JOBS) > MAX_JOBS:
+            for jid in list(JOBS):
+                if len(JOBS) <= MAX_JOBS:
+                    break
+                if JOBS[jid].status in {"done", "error"}:
+                    del JOBS[jid]
+                    shared.pop(jid, None)
+
+    job.future = pool.submit(run_job_process, job_id, req.model_dump(), shared)
+    return {"id": job_id}
 
-    def _worker():
-        try:
-            rasterize(job, req)
-        except Exception as exc:  # noqa: BLE001
-            job.status = "error"
-            job.error = str(exc)
-            log(job, f"Error: {exc}")
 
-    threading.Thread(target=_worker, daemon=True).start()
-    return {"id": job_id}
+def job_snapshot(job: JobState, with_logs: bool = True) -> dict[str, Any]:
+    with job.lock:
+        snap: dict[str, Any] = {
+            "id": job.id,
+            "status": job.status,
+            "progress_pct": job.progress_pct,
+            "progress_message": job.progress_message,
+            "error": job.error,
+            "outputs": job.outputs,
+            "overlay_bounds": job.overlay_bounds,
+            "stats": job.stats,
+        }
+        if with_logs:
+            snap["logs"] = list(job.logs)
+    return snap
 
 
 @app.get("/jobs/{job_id}")
 def get_job(job_id: str):
-    job = JOBS.get(job_id)
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+    if not job:
+        raise HTTPException(404, "job not found")
+    _sync_job(job)
+    return job_snapshot(job)
+
+
+@app.get("/jobs/{job_id}/events")
+def job_events(job_id: str):
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
     if not job:
         raise HTTPException(404, "job not found")
-    return {
-        "id": job.id,
-        "status": job.status,
-        "progress_pct": job.progress_pct,
-        "progress_message": job.progress_message,
-        "error": job.error,
-        "logs": job.logs[-400:],
-        "outputs": job.outputs,
-        "overlay_bounds": job.overlay_bounds,
-        "stats": job.stats,
-    }
+
+    def _stream():
+        while True:
+            _sync_job(job)
+            yield f"data: {json.dumps(job_snapshot(job, with_logs=False))}\n\n"
+            if job.status in {"done", "error"}:
+                break
+            # Timeout doubles as a keepalive so silent progress (pct-only
+            # updates) still reaches the client.
+            job.updated.wait(timeout=2.0)
+            job.updated.clear()
+
+    return StreamingResponse(_stream(), media_type="text/event-stream")
 
 
 @app.get("/jobs/{job_id}/files/{kind}")
 def get_file(job_id: str, kind: str):
-    job = JOBS.get(job_id)
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
     if not job:
         raise HTTPException(404, "job not found")
+    _sync_job(job)
     p = job.outputs.get(kind)
     if not p:
         raise HTTPException(404, "file kind not available")